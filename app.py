@@ -1,31 +1,59 @@
-from flask import Flask, jsonify
+import time
+_import_started = time.perf_counter()
+
+from flask import Flask, g, jsonify
 import logging
 
-from orderchat.db import init_db
+from orderchat import warmup
+from orderchat.db import ensure_db
 from orderchat.views import orders_bp
 from orderchat.bot import bot_bp
 
+warmup.mark_import_start(_import_started)
+
 app = Flask(__name__)
 
 logging.basicConfig(level=logging.INFO)
 app.logger.setLevel(logging.INFO)
 
 
+@app.before_request
+def lazy_init():
+    if warmup.first_request_pending():
+        g.request_started = time.perf_counter()
+    # Schema is created on first use when warm-up has not run (e.g. no gunicorn hooks)
+    ensure_db()
+    warmup.start_background_warm_up()
+
+
+@app.after_request
+def time_first_request(response):
+    started = g.pop('request_started', None)
+    if started is not None:
+        warmup.record_first_request((time.perf_counter() - started) * 1000)
+    return response
+
+
 @app.get('/')
 def health_check():
     return jsonify({"status": "healthy", "service": "whatsapp-restaurant-bot"}), 200
 
 
+@app.get('/ready')
+def readiness_check():
+    status = warmup.status()
+    return jsonify(status), 200 if status["ready"] else 503
+
+
 # Register blueprints
 app.register_blueprint(bot_bp)
 app.register_blueprint(orders_bp)
 
 
-# Initialize database on startup
-init_db()
-
-
 if __name__ == '__main__':
     import os
+    from orderchat.maintenance import start_scheduler
+    warmup.warm_up()
+    start_scheduler()
     port = int(os.environ.get('PORT', 5000))
-    app.run(host='0.0.0.0', port=port)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=port)
@@ -0,0 +1,25 @@
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+
+# Import the app once in the master so warm-up happens before fork and
+# workers share the loaded modules / model weights copy-on-write.
+preload_app = True
+
+
+def when_ready(server):
+    # Runs in the master after the app is preloaded, before workers spawn
+    from orderchat.warmup import warm_up
+    warm_up()
+
+
+def post_worker_init(worker):
+    # No-op when the master already warmed up; covers preload_app = False
+    from orderchat.warmup import warm_up
+    warm_up()
+    # Start maintenance in workers only: a thread in the master would be
+    # forked mid-lock into respawned workers. Every worker runs a scheduler;
+    # the lock file records the last pass so only one pass runs per interval.
+    from orderchat.maintenance import start_scheduler
+    start_scheduler()
@@ -8,6 +8,20 @@ WHATSAPP_TOKEN = os.environ.get('WHATSAPP_ACCESS_TOKEN')
 PHONE_NUMBER_ID = os.environ.get('WHATSAPP_PHONE_NUMBER_ID')
 ANTHROPIC_API_KEY = os.environ.get('ANTHROPIC_API_KEY')
 
+# Warm-up: which lazily-built resources to preload before serving
+WARMUP_LLM = os.environ.get('WARMUP_LLM', '1').lower() not in {'0', 'false', 'no'}
+WARMUP_EMBEDDINGS = os.environ.get('WARMUP_EMBEDDINGS', '0').lower() not in {'0', 'false', 'no'}
+
+# Retention / maintenance settings
+MAINTENANCE_ENABLED = os.environ.get('MAINTENANCE_ENABLED', '1').lower() not in {'0', 'false', 'no'}
+MAINTENANCE_INTERVAL_SECONDS = int(os.environ.get('MAINTENANCE_INTERVAL_SECONDS', 600))
+# Max wall time a single maintenance step may hold the database
+MAINTENANCE_SLICE_MS = int(os.environ.get('MAINTENANCE_SLICE_MS', 50))
+MAINTENANCE_BATCH_SIZE = int(os.environ.get('MAINTENANCE_BATCH_SIZE', 200))
+DRAFT_TTL_HOURS = int(os.environ.get('DRAFT_TTL_HOURS', 24))
+CONVERSATION_TTL_DAYS = int(os.environ.get('CONVERSATION_TTL_DAYS', 30))
+ORDER_ARCHIVE_MONTHS = int(os.environ.get('ORDER_ARCHIVE_MONTHS', 6))
+
 # Expanded structured menu
 MENU_CATEGORIES: Dict[str, Dict[str, float]] = {
     'pizzas': {
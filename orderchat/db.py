@@ -1,10 +1,20 @@
 import sqlite3
 import json
+import logging
+import threading
+import zlib
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from .config import DRAFT_TTL_HOURS
+
 DB_NAME = 'restaurant_bot.db'
 
+log = logging.getLogger(__name__)
+
+_schema_lock = threading.Lock()
+_schema_ready = False
+
 
 def get_conn():
     return sqlite3.connect(DB_NAME)
@@ -14,6 +24,17 @@ def init_db():
     conn = get_conn()
     cursor = conn.cursor()
 
+    # Incremental auto-vacuum lets maintenance reclaim pages in small slices.
+    # It only applies to a fresh file here; an existing database needs the
+    # one-off full VACUUM in `python -m orderchat.maintenance --migrate`.
+    cursor.execute('PRAGMA auto_vacuum')
+    if cursor.fetchone()[0] != 2:
+        cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'table'")
+        if cursor.fetchone()[0]:
+            log.warning("auto_vacuum is not INCREMENTAL; run 'python -m orderchat.maintenance --migrate' offline to enable page reclaim")
+        else:
+            cursor.execute('PRAGMA auto_vacuum = INCREMENTAL')
+
     cursor.execute(
         '''
         CREATE TABLE IF NOT EXISTS conversations (
@@ -49,10 +70,40 @@ def init_db():
         '''
     )
 
+    cursor.execute(
+        '''
+        CREATE TABLE IF NOT EXISTS orders_archive (
+            id INTEGER PRIMARY KEY, -- original orders.id
+            phone_number TEXT,
+            items BLOB, -- zlib-compressed JSON array
+            total REAL,
+            status TEXT,
+            created_at TIMESTAMP,
+            archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        '''
+    )
+
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_orders_created_at ON orders (created_at)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_conversations_updated_at ON conversations (updated_at)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_order_drafts_updated_at ON order_drafts (updated_at)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_orders_archive_phone ON orders_archive (phone_number, created_at)')
+
     conn.commit()
     conn.close()
 
 
+def ensure_db():
+    """Run init_db once per process, on first use rather than at import."""
+    global _schema_ready
+    if _schema_ready:
+        return
+    with _schema_lock:
+        if not _schema_ready:
+            init_db()
+            _schema_ready = True
+
+
 # Conversation helpers
 
 def get_conversation_history(phone_number: str) -> List[Dict[str, Any]]:
@@ -123,6 +174,49 @@ def list_orders():
     return out
 
 
+# Archive helpers
+
+def compress_items(items_json: str) -> bytes:
+    return zlib.compress((items_json or '[]').encode('utf-8'))
+
+
+def decompress_items(blob: Optional[bytes]) -> list:
+    if not blob:
+        return []
+    try:
+        return json.loads(zlib.decompress(blob).decode('utf-8'))
+    except Exception:
+        return []
+
+
+ARCHIVE_MAX_LIMIT = 500
+
+
+def list_archived_orders(phone_number: Optional[str] = None, limit: int = 100):
+    # SQLite treats a negative LIMIT as unbounded; never decompress the whole archive
+    limit = max(1, min(int(limit), ARCHIVE_MAX_LIMIT))
+    conn = get_conn()
+    cursor = conn.cursor()
+    query = 'SELECT id, phone_number, items, total, status, created_at, archived_at FROM orders_archive'
+    params: tuple = ()
+    if phone_number:
+        query += ' WHERE phone_number = ?'
+        params = (phone_number,)
+    query += ' ORDER BY created_at DESC LIMIT ?'
+    cursor.execute(query, params + (limit,))
+    rows = cursor.fetchall()
+    conn.close()
+    return [{
+        'id': r[0],
+        'phone_number': r[1],
+        'items': decompress_items(r[2]),
+        'total': r[3],
+        'status': r[4],
+        'created_at': r[5],
+        'archived_at': r[6]
+    } for r in rows]
+
+
 # Draft helpers
 
 def set_order_draft(phone_number: str, draft: Dict[str, Any]):
@@ -139,7 +233,11 @@ def set_order_draft(phone_number: str, draft: Dict[str, Any]):
 def get_order_draft(phone_number: str) -> Optional[Dict[str, Any]]:
     conn = get_conn()
     cursor = conn.cursor()
-    cursor.execute('SELECT draft FROM order_drafts WHERE phone_number = ?', (phone_number,))
+    # Drafts past their TTL are treated as gone even before maintenance purges them
+    cursor.execute(
+        '''SELECT draft FROM order_drafts WHERE phone_number = ? AND updated_at >= datetime('now', ?)''',
+        (phone_number, f'-{DRAFT_TTL_HOURS} hours')
+    )
     row = cursor.fetchone()
     conn.close()
     if row and row[0]:
@@ -1,17 +1,36 @@
 from __future__ import annotations
-from typing import List, Tuple
-import numpy as np
-from sklearn.linear_model import LogisticRegression
-from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics.pairwise import cosine_similarity
-from sentence_transformers import SentenceTransformer
+from typing import TYPE_CHECKING, List, Tuple
+import threading
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Lightweight embedding + simple classifier to gate LLM usage.
+# numpy / sklearn / sentence-transformers are imported on first use so that
+# importing this module stays cheap.
+
+MODEL_NAME = 'all-MiniLM-L6-v2'
+
+_model_lock = threading.Lock()
+_model = None
+
+
+def get_embedding_model():
+    """Load (and download if needed) the shared SentenceTransformer once per process."""
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                from sentence_transformers import SentenceTransformer
+                _model = SentenceTransformer(MODEL_NAME)
+    return _model
 
-# Lightweight embedding + simple classifier to gate LLM usage
 
 class IntentGate:
     def __init__(self):
-        self.model = SentenceTransformer('all-MiniLM-L6-v2')
+        from sklearn.linear_model import LogisticRegression
+        from sklearn.pipeline import Pipeline
+        from sklearn.preprocessing import StandardScaler
         # Simple logistic regression on pooled embeddings
         self.clf = Pipeline([
             ('scaler', StandardScaler(with_mean=False)),
@@ -19,7 +38,12 @@ class IntentGate:
         ])
         self.trained = False
 
+    @property
+    def model(self):
+        return get_embedding_model()
+
     def embed(self, texts: List[str]) -> np.ndarray:
+        import numpy as np
         return np.array(self.model.encode(texts, normalize_embeddings=True))
 
     def fit(self, X_texts: List[str], y: List[int]):
@@ -28,6 +52,8 @@ class IntentGate:
         self.trained = True
 
     def predict_proba(self, texts: List[str]) -> np.ndarray:
+        import numpy as np
+        from sklearn.metrics.pairwise import cosine_similarity
         X = self.embed(texts)
         if not self.trained:
             # Fallback: similarity to prototypical start words
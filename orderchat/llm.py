@@ -1,10 +1,22 @@
 import json
 import re
-import anthropic
+import threading
 from typing import Dict, Any, Optional
 from .config import MENU, MENU_CATEGORIES
 
-claude_client = anthropic.Anthropic()
+_client_lock = threading.Lock()
+_claude_client = None
+
+
+def get_claude_client():
+    """Build the Anthropic client on first use; importing the SDK is slow."""
+    global _claude_client
+    if _claude_client is None:
+        with _client_lock:
+            if _claude_client is None:
+                import anthropic
+                _claude_client = anthropic.Anthropic()
+    return _claude_client
 
 
 def _strip_code_fences(s: str) -> str:
@@ -56,7 +68,7 @@ def extract_order_with_claude(user_message: str) -> Optional[Dict[str, Any]]:
         )
         cleaned_user = user_message.strip()[:800]
         msg = [{"role": "user", "content": cleaned_user}]
-        resp = claude_client.messages.create(
+        resp = get_claude_client().messages.create(
             model="claude-3-haiku-20240307",
             max_tokens=220,
             system=system_prompt,
@@ -0,0 +1,249 @@
+import fcntl
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+from . import db
+from .config import (
+    MAINTENANCE_ENABLED,
+    MAINTENANCE_INTERVAL_SECONDS,
+    MAINTENANCE_SLICE_MS,
+    MAINTENANCE_BATCH_SIZE,
+    DRAFT_TTL_HOURS,
+    CONVERSATION_TTL_DAYS,
+    ORDER_ARCHIVE_MONTHS,
+)
+from .db import get_conn, ensure_db, compress_items
+
+log = logging.getLogger(__name__)
+
+# Pages released per incremental_vacuum call (4KB pages => ~1MB)
+VACUUM_PAGES_PER_STEP = 256
+# Rows ANALYZE may sample per index, keeps it fast on big tables
+ANALYSIS_LIMIT = 400
+
+
+@contextmanager
+def _exclusive_run(min_interval: float = 0):
+    """Yield True if this process should run a pass now.
+
+    Each gunicorn worker runs a scheduler. The flock stops passes overlapping,
+    and the last pass time stored in the lock file makes the other workers
+    skip until `min_interval` has elapsed, so there is one pass per interval.
+    """
+    with open(f'{db.DB_NAME}.maintenance.lock', 'a+') as fh:
+        try:
+            fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            yield False
+            return
+        try:
+            fh.seek(0)
+            try:
+                last_run = float(fh.read().strip() or 0)
+            except ValueError:
+                last_run = 0.0
+            now = time.time()
+            if min_interval and now - last_run < min_interval:
+                yield False
+                return
+            fh.seek(0)
+            fh.truncate()
+            fh.write(str(now))
+            fh.flush()
+            yield True
+        finally:
+            fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+def _conn():
+    conn = get_conn()
+    # Back off rather than fail if a webhook request holds the write lock
+    conn.execute('PRAGMA busy_timeout = 2000')
+    conn.create_function('zcompress', 1, compress_items)
+    return conn
+
+
+def _run_sliced(step: Callable, budget_ms: int, pause: float = 0.01) -> int:
+    """Repeat `step(conn)` in short transactions until it returns 0 or the time budget runs out.
+    Returns total rows affected."""
+    deadline = time.monotonic() + budget_ms / 1000.0
+    total = 0
+    conn = _conn()
+    try:
+        while time.monotonic() < deadline:
+            with conn:
+                n = step(conn)
+            total += n
+            if n == 0:
+                break
+            # Let waiting writers grab the lock between batches
+            time.sleep(pause)
+    finally:
+        conn.close()
+    return total
+
+
+def purge_expired_drafts(conn, batch_size: int = MAINTENANCE_BATCH_SIZE) -> int:
+    cur = conn.execute(
+        '''DELETE FROM order_drafts WHERE id IN (
+               SELECT id FROM order_drafts WHERE updated_at < datetime('now', ?) LIMIT ?
+           )''',
+        (f'-{DRAFT_TTL_HOURS} hours', batch_size)
+    )
+    return cur.rowcount
+
+
+def purge_expired_conversations(conn, batch_size: int = MAINTENANCE_BATCH_SIZE) -> int:
+    cur = conn.execute(
+        '''DELETE FROM conversations WHERE id IN (
+               SELECT id FROM conversations WHERE updated_at < datetime('now', ?) LIMIT ?
+           )''',
+        (f'-{CONVERSATION_TTL_DAYS} days', batch_size)
+    )
+    return cur.rowcount
+
+
+def archive_old_orders(conn, batch_size: int = MAINTENANCE_BATCH_SIZE) -> int:
+    """Move orders older than ORDER_ARCHIVE_MONTHS into orders_archive with compressed items."""
+    ids = [r[0] for r in conn.execute(
+        'SELECT id FROM orders WHERE created_at < datetime(\'now\', ?) ORDER BY id LIMIT ?',
+        (f'-{ORDER_ARCHIVE_MONTHS} months', batch_size)
+    ).fetchall()]
+    if not ids:
+        return 0
+    marks = ','.join('?' * len(ids))
+    conn.execute(
+        f'''INSERT OR REPLACE INTO orders_archive (id, phone_number, items, total, status, created_at)
+            SELECT id, phone_number, zcompress(items), total, status, created_at FROM orders WHERE id IN ({marks})''',
+        ids
+    )
+    conn.execute(f'DELETE FROM orders WHERE id IN ({marks})', ids)
+    return len(ids)
+
+
+def incremental_vacuum(conn, pages: int = VACUUM_PAGES_PER_STEP) -> int:
+    free_before = conn.execute('PRAGMA freelist_count').fetchone()[0]
+    if not free_before:
+        return 0
+    # The pragma frees one page per sqlite3_step; execute() only steps once,
+    # executescript() runs the statement to completion.
+    conn.executescript(f'PRAGMA incremental_vacuum({int(pages)})')
+    free_after = conn.execute('PRAGMA freelist_count').fetchone()[0]
+    return free_before - free_after
+
+
+def analyze(conn) -> int:
+    conn.execute(f'PRAGMA analysis_limit = {ANALYSIS_LIMIT}')
+    conn.execute('PRAGMA optimize')
+    return 0
+
+
+def migrate_auto_vacuum() -> bool:
+    """Switch an existing database to incremental auto-vacuum.
+    Runs a full VACUUM that locks the file; do it offline, not while serving."""
+    ensure_db()
+    conn = get_conn()
+    try:
+        if conn.execute('PRAGMA auto_vacuum').fetchone()[0] == 2:
+            return False
+        conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+        conn.execute('VACUUM')
+        return True
+    finally:
+        conn.close()
+
+
+def run_maintenance(budget_ms: int = MAINTENANCE_SLICE_MS) -> Dict[str, int]:
+    """One maintenance pass. Each task gets its own bounded time slice."""
+    ensure_db()
+    tasks: List = [
+        ('drafts_purged', purge_expired_drafts),
+        ('conversations_purged', purge_expired_conversations),
+        ('orders_archived', archive_old_orders),
+        ('pages_freed', incremental_vacuum),
+        ('analyzed', analyze),
+    ]
+    stats: Dict[str, int] = {}
+    for name, step in tasks:
+        try:
+            stats[name] = _run_sliced(step, budget_ms)
+        except Exception as e:
+            log.error(f"Maintenance task {name} failed: {e}")
+            stats[name] = 0
+    return stats
+
+
+class MaintenanceScheduler:
+    """Daemon thread running run_maintenance every `interval` seconds."""
+
+    def __init__(self, interval: int = MAINTENANCE_INTERVAL_SECONDS, budget_ms: int = MAINTENANCE_SLICE_MS):
+        self.interval = interval
+        self.budget_ms = budget_ms
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name='orderchat-maintenance', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            try:
+                with _exclusive_run(self.interval) as acquired:
+                    if not acquired:
+                        continue
+                    stats = run_maintenance(self.budget_ms)
+            except Exception as e:
+                # Keep the thread alive; the next pass retries
+                log.error(f"Maintenance pass failed: {e}")
+                continue
+            if any(stats.values()):
+                log.info(f"Maintenance pass: {stats}")
+
+
+_scheduler: Optional[MaintenanceScheduler] = None
+
+
+def start_scheduler() -> Optional[MaintenanceScheduler]:
+    """Start this process's scheduler. Call from a worker (e.g. gunicorn
+    post_worker_init), never at import or in a process that will fork."""
+    global _scheduler
+    if not MAINTENANCE_ENABLED:
+        return None
+    if _scheduler is None:
+        _scheduler = MaintenanceScheduler()
+    _scheduler.start()
+    return _scheduler
+
+
+if __name__ == '__main__':
+    # Standalone entry point for cron / a sidecar: python -m orderchat.maintenance [--once | --migrate]
+    import argparse
+    parser = argparse.ArgumentParser(description='OrderChat retention and compaction')
+    parser.add_argument('--once', action='store_true', help='run a single pass and exit')
+    parser.add_argument('--migrate', action='store_true', help='one-off VACUUM to enable incremental auto-vacuum')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    if args.migrate:
+        print('Migrated to incremental auto-vacuum' if migrate_auto_vacuum() else 'Already incremental')
+    elif args.once:
+        with _exclusive_run() as acquired:
+            print(run_maintenance() if acquired else 'Another process is running maintenance')
+    else:
+        scheduler = MaintenanceScheduler()
+        scheduler.start()
+        try:
+            scheduler._thread.join()
+        except KeyboardInterrupt:
+            scheduler.stop()
@@ -1,5 +1,5 @@
-from flask import Blueprint, jsonify
-from .db import list_orders
+from flask import Blueprint, jsonify, request
+from .db import list_orders, list_archived_orders
 
 orders_bp = Blueprint('orders', __name__)
 
@@ -9,6 +9,13 @@ def api_orders():
     return jsonify({"orders": list_orders()})
 
 
+@orders_bp.get('/api/orders/archive')
+def api_archived_orders():
+    phone = request.args.get('phone')
+    limit = request.args.get('limit', 100, type=int)
+    return jsonify({"orders": list_archived_orders(phone, limit)})
+
+
 @orders_bp.get('/orders')
 def orders_page():
     orders = list_orders()
@@ -0,0 +1,114 @@
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from .config import WARMUP_LLM, WARMUP_EMBEDDINGS
+from .db import ensure_db
+
+log = logging.getLogger(__name__)
+
+# Set by app.py before its heavy imports; used for import-to-ready timing
+_import_started: Optional[float] = None
+_warmup_ms: Optional[float] = None
+_ready = threading.Event()
+_lock = threading.Lock()
+_background: Optional[threading.Thread] = None
+_import_to_ready_ms: Optional[float] = None
+# Set when warm-up was started lazily by a request rather than a server hook
+_started_by_request = False
+_first_request_ms: Optional[float] = None
+# Background warm-up failures back off before the next request retries
+RETRY_BACKOFF_SECONDS = 30.0
+_last_failure: Optional[float] = None
+_last_error: Optional[str] = None
+
+
+def mark_import_start(t: Optional[float] = None):
+    global _import_started
+    if _import_started is None:
+        _import_started = t if t is not None else time.perf_counter()
+
+
+def warm_up(llm: bool = WARMUP_LLM, embeddings: bool = WARMUP_EMBEDDINGS):
+    """Build the DB schema and shared clients up front. Idempotent.
+
+    Under gunicorn with preload_app this runs in the master before fork, so
+    workers inherit the loaded modules copy-on-write.
+    """
+    global _warmup_ms, _import_to_ready_ms
+    if _ready.is_set():
+        return
+    with _lock:
+        if _ready.is_set():
+            return
+        started = time.perf_counter()
+        ensure_db()
+        if llm:
+            from .llm import get_claude_client
+            get_claude_client()
+        if embeddings:
+            from .embeddings import get_embedding_model
+            get_embedding_model()
+        finished = time.perf_counter()
+        _warmup_ms = round((finished - started) * 1000, 1)
+        if _import_started is not None and not _started_by_request:
+            # Cold-start figure: app import until ready to serve. Skipped on the
+            # lazy path, where it would include idle time before the first request.
+            _import_to_ready_ms = round((finished - _import_started) * 1000, 1)
+        _ready.set()
+        log.info(f"Warm-up done in {_warmup_ms}ms (import to ready: {_import_to_ready_ms}ms)")
+
+
+def _background_warm_up():
+    global _background, _last_failure, _last_error
+    try:
+        warm_up()
+        _last_error = None
+    except Exception as e:
+        log.error(f"Warm-up failed: {e}")
+        _last_error = str(e)
+        _last_failure = time.monotonic()
+        # Allow a later request to retry once the backoff has passed
+        _background = None
+
+
+def start_background_warm_up():
+    """Warm up in a thread when no server hook did (flask run, uwsgi, waitress),
+    so /ready eventually passes without blocking the request that triggered it."""
+    global _background, _started_by_request
+    if _ready.is_set() or _background is not None:
+        return
+    if _last_failure is not None and time.monotonic() - _last_failure < RETRY_BACKOFF_SECONDS:
+        return
+    with _lock:
+        if _background is None and not _ready.is_set():
+            _started_by_request = True
+            _background = threading.Thread(target=_background_warm_up, name='orderchat-warmup', daemon=True)
+            _background.start()
+
+
+def record_first_request(elapsed_ms: float):
+    """Latency of this process's first request, including any lazy initialization."""
+    global _first_request_ms
+    if _first_request_ms is None:
+        _first_request_ms = round(elapsed_ms, 1)
+        log.info(f"First request served in {_first_request_ms}ms")
+
+
+def first_request_pending() -> bool:
+    return _first_request_ms is None
+
+
+def is_ready() -> bool:
+    return _ready.is_set()
+
+
+def status() -> Dict[str, Any]:
+    return {
+        "ready": is_ready(),
+        "warmup_ms": _warmup_ms,
+        "import_to_ready_ms": _import_to_ready_ms,
+        "first_request_ms": _first_request_ms,
+        "last_error": _last_error,
+    }
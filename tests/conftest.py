@@ -0,0 +1,32 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from orderchat import db  # noqa: E402
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, 'DB_NAME', str(tmp_path / 'test.db'))
+    monkeypatch.setattr(db, '_schema_ready', False)
+    db.ensure_db()
+    return db.DB_NAME
+
+
+@pytest.fixture
+def app_module():
+    """Import app.py, skipping where it cannot load.
+
+    orderchat/views.py uses a backslash inside an f-string expression, which
+    only parses on Python 3.12+; on older interpreters these tests skip rather
+    than count as /ready or app coverage.
+    """
+    pytest.importorskip('flask')
+    pytest.importorskip('requests')
+    if sys.version_info < (3, 12):
+        pytest.skip('app.py needs Python 3.12+ (f-string syntax in orderchat/views.py)')
+    import app
+    return app
@@ -0,0 +1,31 @@
+from orderchat import db
+
+
+def _insert_archived(n):
+    conn = db.get_conn()
+    conn.executemany(
+        'INSERT INTO orders_archive (id, phone_number, items, total, status, created_at) VALUES (?, ?, ?, ?, ?, ?)',
+        [(i, 'p', db.compress_items('[]'), 1.0, 'pending', '2020-01-01 00:00:00') for i in range(1, n + 1)]
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_list_archived_orders_clamps_limit(temp_db):
+    _insert_archived(db.ARCHIVE_MAX_LIMIT + 5)
+    assert len(db.list_archived_orders(limit=-1)) == 1
+    assert len(db.list_archived_orders(limit=0)) == 1
+    assert len(db.list_archived_orders(limit=10_000)) == db.ARCHIVE_MAX_LIMIT
+
+
+def test_get_order_draft_ignores_expired(temp_db):
+    db.set_order_draft('fresh', {'items': [], 'total': 0.0})
+    conn = db.get_conn()
+    conn.execute(
+        "INSERT INTO order_drafts (phone_number, draft, updated_at) VALUES ('stale', '{}', datetime('now', ?))",
+        (f'-{db.DRAFT_TTL_HOURS + 1} hours',)
+    )
+    conn.commit()
+    conn.close()
+    assert db.get_order_draft('fresh') == {'items': [], 'total': 0.0}
+    assert db.get_order_draft('stale') is None
@@ -0,0 +1,139 @@
+import threading
+import time
+
+from orderchat import db, maintenance
+
+
+def _free_pages(conn):
+    return conn.execute('PRAGMA freelist_count').fetchone()[0]
+
+
+def test_incremental_vacuum_frees_requested_pages(temp_db):
+    conn = db.get_conn()
+    conn.executemany('INSERT INTO conversations (phone_number, messages) VALUES (?, ?)',
+                     [(f'p{i}', 'x' * 3000) for i in range(600)])
+    conn.commit()
+    conn.execute('DELETE FROM conversations')
+    conn.commit()
+    before = _free_pages(conn)
+    assert before > 300
+
+    with conn:
+        freed = maintenance.incremental_vacuum(conn, pages=256)
+
+    assert freed == 256
+    assert _free_pages(conn) == before - 256
+    conn.close()
+
+
+def test_scheduler_survives_failed_pass(temp_db, monkeypatch):
+    calls = []
+
+    def boom(budget_ms):
+        calls.append(budget_ms)
+        raise RuntimeError('database is locked')
+
+    monkeypatch.setattr(maintenance, 'run_maintenance', boom)
+    scheduler = maintenance.MaintenanceScheduler(interval=0.01)
+    scheduler.start()
+    try:
+        deadline = 100
+        while len(calls) < 2 and deadline:
+            scheduler._stop.wait(0.01)
+            deadline -= 1
+        assert len(calls) >= 2
+        assert scheduler._thread.is_alive()
+    finally:
+        scheduler.stop()
+
+
+def test_exclusive_run_allows_one_holder(temp_db):
+    with maintenance._exclusive_run() as first:
+        with maintenance._exclusive_run() as second:
+            assert first is True
+            assert second is False
+    with maintenance._exclusive_run() as again:
+        assert again is True
+
+
+def test_exclusive_run_skips_within_interval(temp_db):
+    with maintenance._exclusive_run(60) as first:
+        assert first is True
+    with maintenance._exclusive_run(60) as second:
+        assert second is False
+    with maintenance._exclusive_run(0) as forced:
+        assert forced is True
+
+
+def test_two_schedulers_run_one_pass_per_interval(temp_db, monkeypatch):
+    passes = []
+    monkeypatch.setattr(maintenance, 'run_maintenance', lambda budget_ms: passes.append(time.time()) or {})
+    interval = 0.2
+    schedulers = [maintenance.MaintenanceScheduler(interval=interval) for _ in range(2)]
+    for scheduler in schedulers:
+        scheduler.start()
+    time.sleep(interval * 3 + 0.1)
+    for scheduler in schedulers:
+        scheduler.stop()
+
+    # Two workers without coordination would give ~6 passes
+    assert 2 <= len(passes) <= 4
+    gaps = [b - a for a, b in zip(passes, passes[1:])]
+    assert all(gap >= interval * 0.9 for gap in gaps)
+
+
+def test_import_app_does_not_start_scheduler(app_module):
+    assert maintenance._scheduler is None
+    assert not any(t.name == 'orderchat-maintenance' and t.is_alive() for t in threading.enumerate())
+
+
+def test_init_db_does_not_vacuum_existing_db(tmp_path, monkeypatch):
+    import sqlite3
+    path = str(tmp_path / 'legacy.db')
+    legacy = sqlite3.connect(path)
+    legacy.execute('CREATE TABLE legacy (id INTEGER PRIMARY KEY)')
+    legacy.commit()
+    legacy.close()
+    monkeypatch.setattr(db, 'DB_NAME', path)
+    monkeypatch.setattr(db, '_schema_ready', False)
+
+    db.ensure_db()
+    conn = db.get_conn()
+    assert conn.execute('PRAGMA auto_vacuum').fetchone()[0] == 0
+    conn.close()
+
+    assert maintenance.migrate_auto_vacuum() is True
+    conn = db.get_conn()
+    assert conn.execute('PRAGMA auto_vacuum').fetchone()[0] == 2
+    conn.close()
+    assert maintenance.migrate_auto_vacuum() is False
+
+
+def test_run_maintenance_purges_and_archives(temp_db):
+    conn = db.get_conn()
+    conn.execute("INSERT INTO order_drafts (phone_number, draft, updated_at) VALUES ('old', '{}', datetime('now', '-30 days'))")
+    conn.execute("INSERT INTO order_drafts (phone_number, draft) VALUES ('new', '{}')")
+    conn.execute("INSERT INTO conversations (phone_number, messages, updated_at) VALUES ('old', '[]', datetime('now', '-365 days'))")
+    conn.execute("INSERT INTO conversations (phone_number, messages) VALUES ('new', '[]')")
+    conn.execute(
+        "INSERT INTO orders (phone_number, items, total, created_at) VALUES ('old', ?, 12.0, datetime('now', '-5 years'))",
+        ('[{"name": "Tiramisu", "quantity": 2}]',)
+    )
+    conn.commit()
+    conn.close()
+    new_id = db.save_order('new', [{'name': 'Cheesecake', 'quantity': 1}], 6.5)
+
+    stats = maintenance.run_maintenance(budget_ms=1000)
+
+    assert stats['drafts_purged'] == 1
+    assert stats['conversations_purged'] == 1
+    assert stats['orders_archived'] == 1
+    assert [o['id'] for o in db.list_orders()] == [new_id]
+    archived = db.list_archived_orders('old')
+    assert len(archived) == 1
+    assert archived[0]['items'] == [{'name': 'Tiramisu', 'quantity': 2}]
+    assert archived[0]['total'] == 12.0
+    conn = db.get_conn()
+    assert conn.execute('SELECT phone_number FROM order_drafts').fetchall() == [('new',)]
+    assert conn.execute('SELECT phone_number FROM conversations').fetchall() == [('new',)]
+    conn.close()
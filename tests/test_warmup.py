@@ -0,0 +1,107 @@
+import threading
+import time
+
+import pytest
+
+from orderchat import db, warmup
+
+
+@pytest.fixture
+def fresh_warmup(monkeypatch, temp_db):
+    monkeypatch.setattr(warmup, '_ready', threading.Event())
+    monkeypatch.setattr(warmup, '_background', None)
+    monkeypatch.setattr(warmup, '_warmup_ms', None)
+    monkeypatch.setattr(warmup, '_import_to_ready_ms', None)
+    monkeypatch.setattr(warmup, '_import_started', None)
+    monkeypatch.setattr(warmup, '_started_by_request', False)
+    monkeypatch.setattr(warmup, '_first_request_ms', None)
+    monkeypatch.setattr(warmup, '_last_failure', None)
+    monkeypatch.setattr(warmup, '_last_error', None)
+    return warmup
+
+
+def test_ensure_db_runs_init_once(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setattr(db, 'DB_NAME', str(tmp_path / 'once.db'))
+    monkeypatch.setattr(db, '_schema_ready', False)
+    monkeypatch.setattr(db, 'init_db', lambda: calls.append(1))
+    db.ensure_db()
+    db.ensure_db()
+    assert calls == [1]
+
+
+def test_warm_up_reports_import_to_ready(fresh_warmup):
+    fresh_warmup.mark_import_start(time.perf_counter())
+    assert fresh_warmup.status()['ready'] is False
+    fresh_warmup.warm_up(llm=False, embeddings=False)
+    status = fresh_warmup.status()
+    assert status['ready'] is True
+    assert status['warmup_ms'] is not None
+    assert status['import_to_ready_ms'] >= status['warmup_ms']
+
+
+def test_lazy_warm_up_does_not_report_import_to_ready(fresh_warmup, monkeypatch):
+    fresh_warmup.mark_import_start(time.perf_counter() - 60)
+    real_warm_up = fresh_warmup.warm_up
+    monkeypatch.setattr(fresh_warmup, 'warm_up', lambda: real_warm_up(llm=False, embeddings=False))
+
+    fresh_warmup.start_background_warm_up()
+    fresh_warmup._background.join(1)
+
+    status = fresh_warmup.status()
+    assert status['ready'] is True
+    assert status['warmup_ms'] is not None
+    # Would otherwise include the 60s the process sat idle before traffic
+    assert status['import_to_ready_ms'] is None
+
+
+def test_background_warm_up_backs_off_then_retries(fresh_warmup, monkeypatch):
+    attempts = []
+    real_warm_up = fresh_warmup.warm_up
+
+    def flaky_warm_up():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError('model download failed')
+        real_warm_up(llm=False, embeddings=False)
+
+    monkeypatch.setattr(fresh_warmup, 'warm_up', flaky_warm_up)
+
+    fresh_warmup.start_background_warm_up()
+    fresh_warmup._background.join(1)
+    assert not fresh_warmup.is_ready()
+    assert fresh_warmup.status()['last_error'] == 'model download failed'
+
+    # Within the backoff window no new attempt starts
+    fresh_warmup.start_background_warm_up()
+    assert fresh_warmup._background is None
+    assert len(attempts) == 1
+
+    monkeypatch.setattr(fresh_warmup, '_last_failure', time.monotonic() - fresh_warmup.RETRY_BACKOFF_SECONDS - 1)
+    fresh_warmup.start_background_warm_up()
+    fresh_warmup._background.join(1)
+    assert len(attempts) == 2
+    assert fresh_warmup.is_ready()
+    assert fresh_warmup.status()['last_error'] is None
+
+
+def test_ready_endpoint_503_then_200(fresh_warmup, monkeypatch, app_module):
+    gate = threading.Event()
+    real_warm_up = fresh_warmup.warm_up
+
+    def slow_warm_up():
+        gate.wait(1)
+        real_warm_up(llm=False, embeddings=False)
+
+    monkeypatch.setattr(fresh_warmup, 'warm_up', slow_warm_up)
+    client = app_module.app.test_client()
+    assert client.get('/').status_code == 200
+    assert client.get('/ready').status_code == 503
+    gate.set()
+    fresh_warmup._background.join(1)
+    resp = client.get('/ready')
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert body['ready'] is True
+    assert body['import_to_ready_ms'] is None
+    assert body['first_request_ms'] is not None